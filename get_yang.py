@@ -1,35 +1,123 @@
 import hashlib
 import os
+import queue
+import shutil
 import subprocess
 import sys
+import threading
 import time
-import xml.etree.ElementTree as ET
+import xml.parsers.expat
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from io import BytesIO
+
+try:
+    from lxml import etree as ET
+
+    HAVE_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+    HAVE_LXML = False
+
+try:
+    from blake3 import blake3 as _new_hash
+except ImportError:
+    _new_hash = hashlib.sha256
+
+# Directory under the output path where downloaded schemas are shared
+# between hosts, keyed by identifier@version.
+CACHE_DIR_NAME = ".cache"
+
+# NETCONF end-of-message framing sentinel.
+FRAME_DELIMITER = b"]]>]]>"
+
+# Fully qualified tag names for the ietf-netconf-monitoring namespace,
+# built once here instead of on every find call.
+NCM_NS = "{urn:ietf:params:xml:ns:yang:ietf-netconf-monitoring}"
+NCM_SCHEMA = NCM_NS + "schema"
+NCM_IDENTIFIER = NCM_NS + "identifier"
+NCM_VERSION = NCM_NS + "version"
+NCM_FORMAT = NCM_NS + "format"
+
+GET_SCHEMA_TEMPLATE = """
+<rpc xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="{mid}">
+  <get-schema xmlns="urn:ietf:params:xml:ns:yang:ietf-netconf-monitoring">
+    <identifier>{identifier}</identifier>
+    <version>{version}</version>
+    <format>yang</format>
+  </get-schema>
+</rpc>
+]]>]]>"""
 
 
 def calculate_checksum(file_path):
-    hash_md5 = hashlib.md5()
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_md5.update(chunk)
-    return hash_md5.hexdigest()
+    file_hash = _new_hash()
+    buf = bytearray(1 << 20)
+    view = memoryview(buf)
 
+    # Read into one preallocated buffer and hash through a memoryview, so
+    # no bytes object is allocated per chunk and the C hash update runs
+    # with the GIL released.
+    with open(file_path, "rb", buffering=0) as f:
+        while n := f.readinto(buf):
+            file_hash.update(view[:n])
 
-def compare_checksums(root_dir):
-    file_checksums = defaultdict(dict)
+    return file_hash.hexdigest()
+
+
+def iter_files(root_dir):
+    """
+    Yield every file path under root_dir, skipping the schema cache. The
+    DirEntry objects carry the file type from the readdir record, so the
+    traversal needs no stat call per entry.
+    """
+
+    with os.scandir(root_dir) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name != CACHE_DIR_NAME:
+                    yield from iter_files(entry.path)
+            else:
+                yield entry.path
+
+
+def compare_checksums(root_dir, file_checksums=None):
+    """
+    Compare checksums of same-named files across the host directories. When
+    a file_checksums map recorded during download is passed in, nothing is
+    rehashed. Note that cached modules are hardlinked between hosts, so a
+    cross-host divergence is only observable when a host downloaded its
+    copy itself before the module reached the cache; linked copies are
+    identical by construction.
+    """
+
+    if file_checksums is None:
+        file_checksums = defaultdict(dict)
+
+        paths = list(iter_files(root_dir))
+
+        # Every file hashes independently, so spread the work over all cores.
+        with ProcessPoolExecutor() as executor:
+            checksums = list(executor.map(calculate_checksum, paths, chunksize=8))
+
+        for file_path, checksum in zip(paths, checksums):
+            file_checksums[os.path.basename(file_path)][file_path] = checksum
 
-    for dirpath, dirnames, filenames in os.walk(root_dir):
-        for filename in filenames:
-            file_path = os.path.join(dirpath, filename)
-            checksum = calculate_checksum(file_path)
-            file_checksums[filename][file_path] = checksum
+    mismatch = False
 
     for filename, paths_checksums in file_checksums.items():
         if len(paths_checksums) > 1:
-            checksums = set(paths_checksums.values())
-            if len(checksums) != 1:
-                print("\n\nFiles have different checksums:")
-    else:
+            if len(set(paths_checksums.values())) != 1:
+                if not mismatch:
+                    print("\n\nFiles have different checksums:")
+                    mismatch = True
+
+                print(f"  {filename}:")
+                for file_path, checksum in paths_checksums.items():
+                    print(f"    {checksum}  {file_path}")
+
+    if not mismatch:
         print("\n\nAll YANG models have identical checksums.")
 
 
@@ -54,6 +142,7 @@ class SSHClient:
         self.client = None
         self.__connected = False
         self.__debug = debug
+        self.__rxbuf = bytearray()
 
         self.netconf_hello = """
 <?xml version="1.0" encoding="UTF-8"?>
@@ -74,16 +163,6 @@ class SSHClient:
     </filter>
   </get>
 </rpc>
-]]>]]>"""
-
-        self.netconf_get_schema = """
-<rpc xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="104">
-  <get-schema xmlns="urn:ietf:params:xml:ns:yang:ietf-netconf-monitoring">
-    <identifier>{{IDENTIFIER}}</identifier>
-    <version>{{VERSION}}</version>
-    <format>yang</format>
-  </get-schema>
-</rpc>
 ]]>]]>"""
 
     def connect(self):
@@ -91,7 +170,21 @@ class SSHClient:
         Create a SSH client and connect to the device using the specified
         username and hostname.
         """
-        cmd_args = ["ssh", f"{self.user}@{self.host}"]
+        # BatchMode fails fast instead of hanging on an interactive prompt,
+        # and connection multiplexing lets repeated runs against the same
+        # host skip the TCP/KEX/auth handshake entirely.
+        cmd_args = [
+            "ssh",
+            "-o",
+            "BatchMode=yes",
+            "-o",
+            "ControlMaster=auto",
+            "-o",
+            "ControlPath=~/.ssh/get_yang-%C",
+            "-o",
+            "ControlPersist=60",
+            f"{self.user}@{self.host}",
+        ]
 
         if self.subsystem:
             cmd_args.append("-s")
@@ -105,8 +198,7 @@ class SSHClient:
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                bufsize=1024,
-                universal_newlines=True,
+                bufsize=0,
             )
 
             if self.client.poll() is not None:
@@ -135,28 +227,53 @@ class SSHClient:
             self.__debug_print("Not connected to device")
             sys.exit(1)
 
+    def __read_frame(self):
+        """
+        Read one NETCONF frame from the device, i.e. everything up to the
+        next "]]>]]>" delimiter. Data is read in large chunks to keep the
+        number of syscalls low regardless of how the peer buffers its
+        output. A single read routinely captures bytes past the delimiter —
+        with pipelined RPCs the next reply usually starts in the same chunk
+        — so the remainder is kept in a per-session buffer and served by
+        the following call instead of being discarded.
+        """
+
+        fd = self.client.stdout.fileno()
+        buf = self.__rxbuf
+        start = 0
+
+        while True:
+            idx = buf.find(FRAME_DELIMITER, start)
+            if idx != -1:
+                frame = bytes(buf[:idx]).decode("utf-8")
+                del buf[: idx + len(FRAME_DELIMITER)]
+                return frame
+
+            # Resume the next scan just before the end of the data already
+            # searched, so a delimiter straddling two reads is caught while
+            # each byte is still scanned only once however large the frame
+            # grows.
+            start = max(len(buf) - (len(FRAME_DELIMITER) - 1), 0)
+
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                frame = bytes(buf).decode("utf-8")
+                buf.clear()
+                return frame
+
+            buf += chunk
+
     def read_hello(self):
         """
         Read the hello message from the device. The hello message is sent by
         the device when the NETCONF session is established.
-
-        Figure out if we should read line by line or character by charater.
         """
 
         self.__is_connected()
 
-        data = ""
-
         self.__debug_print("Reading hello message")
 
-        while not self.client.poll():
-            c = self.client.stdout.read(1)
-            data += c
-
-            if "]]>]]>" in data:
-                break
-
-        data = data.replace("]]>]]>", "")
+        data = self.__read_frame()
 
         self.__debug_print("Received hello message:")
         self.__debug_print(data.encode("utf-8"))
@@ -166,11 +283,6 @@ class SSHClient:
             print("NETCONF monitoring not supported")
             sys.exit(1)
 
-        if "\n" in data:
-            self.__newline_data = True
-        else:
-            self.__newline_data = False
-
         return data
 
     def read_command_output(self):
@@ -181,23 +293,9 @@ class SSHClient:
 
         self.__is_connected()
 
-        data = ""
-
         self.__debug_print("Reading data")
 
-        if self.__newline_data:
-            for line in self.client.stdout:
-                data += line
-                if "]]>]]>" in line:
-                    break
-        else:
-            while not self.client.poll():
-                data += self.client.stdout.read(1)
-
-                if "]]>]]>" in data:
-                    break
-
-        data = data.replace("]]>]]>", "")
+        data = self.__read_frame()
 
         self.__debug_print("Received data:")
         self.__debug_print(data.encode("utf-8"))
@@ -217,153 +315,404 @@ class SSHClient:
         self.__debug_print(command)
         self.__debug_print("End of command")
 
-        self.client.stdin.write(command + "\n")
+        self.client.stdin.write((command + "\n").encode("utf-8"))
         self.client.stdin.flush()
 
     def parse_netconf_state(self, data):
         """ "
         Parse the NETCONF state data and return a list of tuples containing the
         module identifier, version, and format.
+
+        The state reply enumerates every schema on the device and can be
+        several MB, so it is parsed incrementally and each schema element is
+        cleared once handled instead of keeping the whole tree in memory.
         """
 
-        root = ET.fromstring(data)
         schemas = []
+        source = BytesIO(data.encode("utf-8"))
 
-        for schema in root.iter(
-            "{urn:ietf:params:xml:ns:yang:ietf-netconf-monitoring}schema"
-        ):
-            identifier = schema.find(
-                "{urn:ietf:params:xml:ns:yang:ietf-netconf-monitoring}identifier"
-            ).text
-
-            version = schema.find(
-                "{urn:ietf:params:xml:ns:yang:ietf-netconf-monitoring}version"
-            ).text
+        if HAVE_LXML:
+            context = ET.iterparse(source, tag=NCM_SCHEMA)
+        else:
+            context = (
+                (event, elem)
+                for event, elem in ET.iterparse(source, events=("end",))
+                if elem.tag == NCM_SCHEMA
+            )
 
-            yangformat = schema.find(
-                "{urn:ietf:params:xml:ns:yang:ietf-netconf-monitoring}format"
-            ).text
+        for _, schema in context:
+            identifier = schema.findtext(NCM_IDENTIFIER)
+            version = schema.findtext(NCM_VERSION)
+            yangformat = schema.findtext(NCM_FORMAT)
 
-            if yangformat != "yang":
+            if yangformat == "yang":
+                schemas.append((identifier, version))
+            else:
                 self.__debug_print(f"Skipping {identifier}@{version} ({yangformat})")
-                continue
 
-            schemas.append((identifier, version))
+            schema.clear()
 
         return schemas
 
-    def get_netconf_schema(self, identifier, version):
+    def submit_schema(self, identifier, version, mid):
         """
-        Get the YANG schema for the specified module identifier and version.
+        Send a get-schema request for the specified module identifier and
+        version without waiting for the reply. The message-id is used to
+        match the reply to the request later.
         """
 
-        command = self.netconf_get_schema.replace("{{IDENTIFIER}}", identifier)
-        command = command.replace("{{VERSION}}", version)
+        command = GET_SCHEMA_TEMPLATE.format(
+            identifier=identifier, version=version, mid=mid
+        )
 
         self.write_command(command)
 
+    def recv_schema(self):
+        """
+        Read one get-schema reply and return a tuple of the message-id and
+        the reply data.
+        """
+
         data = self.read_command_output()
 
-        return data
+        mid = ""
+        start = data.find('message-id="')
+        if start != -1:
+            start += len('message-id="')
+            end = data.find('"', start)
+            mid = data[start:end]
+
+        return mid, data
 
     def parse_netconf_schema_yang(self, data, identifier, version, output_path):
         """
-        Parse the NETCONF schema data and write the YANG schema to a file in
-        the specified output directory.
+        Extract the YANG schema from the get-schema reply and write it to a
+        file in the specified output directory. The data element is the sole
+        child of the reply and its text is the whole module, so a small
+        expat handler collects just that text — streaming, C-implemented
+        and with no tree allocation, and the parser handles entity and
+        CDATA unescaping correctly.
         """
 
-        root = ET.fromstring(data)
-
-        data = root.find(
-            "{urn:ietf:params:xml:ns:yang:ietf-netconf-monitoring}data"
-        ).text
-
+        chunks = []
+        inside = False
+        error = False
+
+        def start_element(name, attrs):
+            nonlocal inside, error
+            inside = name.endswith("}data")
+            if name.endswith("}rpc-error"):
+                error = True
+
+        def end_element(name):
+            nonlocal inside
+            inside = False
+
+        def char_data(text):
+            if inside:
+                chunks.append(text)
+
+        parser = xml.parsers.expat.ParserCreate(namespace_separator="}")
+        parser.buffer_text = True
+        parser.StartElementHandler = start_element
+        parser.EndElementHandler = end_element
+        parser.CharacterDataHandler = char_data
+        parser.Parse(data.encode("utf-8"), True)
+
+        payload = "".join(chunks).strip().encode("utf-8")
+
+        # An rpc-error reply (or any reply without a data element) carries
+        # no schema; writing it out would publish an empty file into the
+        # shared cache and poison every other host.
+        if error or not payload:
+            raise ValueError(
+                f"get-schema for {identifier}@{version} returned no YANG payload"
+            )
         output_path = f"{output_path}/{identifier}@{version}.yang"
-        output_len = len(data)
+        output_len = len(payload)
 
         self.__debug_print(f"Writing to {output_path} ({output_len} bytes)")
 
-        with open(output_path, "w") as f:
-            f.write(data.strip())
+        # Encode once and land the file with a single write syscall instead
+        # of the text-mode writer's encode-and-chunk path.
+        fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
 
         return output_len
 
 
-def main():
-    if len(sys.argv) < 4:
-        print("Usage: get_yang.py <hosts> <user> <output_path> (<debug>)")
-        sys.exit(1)
+def process_host(
+    host, user, output_path, debug, file_checksums, cache_checksums, checksum_lock
+):
+    """
+    Collect all YANG schemas from a single host and write them to the
+    output directory. Checksums are recorded in the shared file_checksums
+    map as files are written, so the final comparison does not have to
+    rehash anything; cache_checksums tracks the hash of each cache inode
+    itself. Returns a tuple with the collection statistics.
+    """
 
-    hosts = sys.argv[1]
-    user = sys.argv[2]
-    output_path = sys.argv[3]
+    host_dir = os.path.join(output_path, host)
+    cache_dir = os.path.join(output_path, CACHE_DIR_NAME)
 
-    debug = False
-    if len(sys.argv) == 5:
-        debug = True
+    os.makedirs(host_dir, exist_ok=True)
 
-    if not os.path.exists(output_path):
-        os.makedirs(output_path)
+    client = SSHClient(host, user, "netconf", debug=debug)
+    client.connect()
 
-    for host in hosts.split(","):
-        if not os.path.exists(output_path + "/" + host):
-            os.makedirs(output_path + "/" + host)
+    # Read the initial hello message
+    client.read_hello()
 
-        client = SSHClient(host, user, "netconf", debug=debug)
-        client.connect()
+    # Answer the hello message
+    client.write_command(client.netconf_hello)
 
-        # Read the initial hello message
-        client.read_hello()
+    # Send the state request
+    client.write_command(client.netconf_state)
 
-        # Answer the hello message
-        client.write_command(client.netconf_hello)
+    # Read the state data
+    data = client.read_command_output()
 
-        # Send the state request
-        client.write_command(client.netconf_state)
+    # Parse the state data
+    states = client.parse_netconf_state(data)
 
-        # Read the state data
-        data = client.read_command_output()
+    sizes = []
+    names = []
 
-        # Parse the state data
-        states = client.parse_netconf_state(data)
+    # Get the schema for each state. NETCONF allows multiple outstanding
+    # RPCs per session, so keep a window of requests in flight and match
+    # the replies back to the requests by message-id. This amortizes the
+    # round-trip time over the whole window instead of paying it per RPC.
+    window = 16
+    pending = {}
+    next_mid = 100
+    next_state = 0
 
-        yang_largest = 0
-        yang_largest_name = ""
-        yang_smallest = 0
-        yang_smallest_name = ""
-        yang_total = 0
-        yang_num = 0
+    # Parsing and disk writes happen in a separate writer thread fed by a
+    # bounded queue, so the session keeps draining replies from the device
+    # while earlier schemas are still being written out. A schema of None
+    # marks a cache hit; None alone shuts the writer down.
+    results = queue.Queue(maxsize=32)
+    writer_errors = []
 
-        # Get the schema for each state
-        time_start = time.time()
+    def writer():
+        while True:
+            item = results.get()
+            if item is None:
+                break
 
-        for state in states:
-            schema = client.get_netconf_schema(state[0], state[1])
-            size = client.parse_netconf_schema_yang(
-                schema, state[0], state[1], output_path + "/" + host
-            )
+            if writer_errors:
+                # Already failed; keep draining the queue so the session
+                # thread never blocks on a full queue or the final join.
+                continue
+
+            identifier, version, schema = item
+            filename = f"{identifier}@{version}.yang"
+            host_path = f"{host_dir}/{filename}"
+            cache_path = f"{cache_dir}/{filename}"
+
+            try:
+                if schema is None:
+                    # Cache hit; link it into the host directory instead of
+                    # downloading it again.
+                    try:
+                        os.link(cache_path, host_path)
+                    except OSError:
+                        shutil.copyfile(cache_path, host_path)
+                    size = os.path.getsize(cache_path)
+
+                    # The linked copy shares the cache inode, so reuse the
+                    # checksum recorded for the cache entry itself when it
+                    # was published — not whichever host's entry happens to
+                    # come first, which may be a divergent self-downloaded
+                    # copy. An entry left over from an earlier run is hashed
+                    # once on first hit.
+                    with checksum_lock:
+                        checksum = cache_checksums.get(filename)
+                    if checksum is None:
+                        checksum = calculate_checksum(cache_path)
+                        with checksum_lock:
+                            cache_checksums.setdefault(filename, checksum)
+                else:
+                    size = client.parse_netconf_schema_yang(
+                        schema, identifier, version, host_dir
+                    )
+
+                    # Publish into the cache; linking makes the file appear
+                    # there atomically, so other threads never see a partial
+                    # write.
+                    published = False
+                    if not os.path.exists(cache_path):
+                        try:
+                            os.link(host_path, cache_path)
+                            published = True
+                        except OSError:
+                            pass
+
+                    # Hash the freshly written file while it is hot in the
+                    # page cache.
+                    checksum = calculate_checksum(host_path)
+
+                    if published:
+                        # The cache entry is this file's inode, so its
+                        # checksum is this one by construction.
+                        with checksum_lock:
+                            cache_checksums.setdefault(filename, checksum)
+            except ValueError as e:
+                # Reply without a usable schema; report it and move on so
+                # one broken module does not abort the whole host.
+                print(f"({host}) {e}")
+                continue
+            except Exception as e:
+                writer_errors.append(e)
+                continue
+
+            with checksum_lock:
+                file_checksums[filename][host_path] = checksum
+
+            sizes.append(size)
+            names.append(identifier + "@" + version)
+
+    writer_thread = threading.Thread(target=writer)
+    writer_thread.start()
+
+    time_start = time.time()
+
+    try:
+        while next_state < len(states) or pending:
+            while next_state < len(states) and len(pending) < window:
+                identifier, version = states[next_state]
+                next_state += 1
+
+                # The same identifier@version has usually already been
+                # fetched from another host or an earlier run.
+                cache_path = f"{cache_dir}/{identifier}@{version}.yang"
+                if os.path.exists(cache_path):
+                    results.put((identifier, version, None))
+                    continue
+
+                mid = str(next_mid)
+                client.submit_schema(identifier, version, mid)
+                pending[mid] = (identifier, version)
+                next_mid += 1
+
+            if pending:
+                mid, schema = client.recv_schema()
+                if mid not in pending:
+                    # Device did not echo a usable message-id; replies still
+                    # come back in order, so fall back to the oldest pending
+                    # request.
+                    mid = next(iter(pending))
+                identifier, version = pending.pop(mid)
+
+                results.put((identifier, version, schema))
+    finally:
+        # Always send the sentinel, also when the session loop dies with the
+        # transport (e.g. BrokenPipeError from a dead ssh process); the
+        # writer is not a daemon thread and would otherwise block on the
+        # queue forever and hang the process.
+        results.put(None)
+        writer_thread.join()
+
+    if writer_errors:
+        raise writer_errors[0]
+
+    time_end = time.time()
+
+    # Reduce once at the end with the C-level builtins instead of
+    # bookkeeping per iteration in the hot loop.
+    yang_num = len(sizes)
+    yang_total = sum(sizes)
+
+    if sizes:
+        i_max = max(range(yang_num), key=sizes.__getitem__)
+        i_min = min(range(yang_num), key=sizes.__getitem__)
+        yang_largest, yang_largest_name = sizes[i_max], names[i_max]
+        yang_smallest, yang_smallest_name = sizes[i_min], names[i_min]
+    else:
+        yang_largest = yang_smallest = 0
+        yang_largest_name = yang_smallest_name = ""
+
+    return (
+        host,
+        yang_num,
+        yang_largest,
+        yang_largest_name,
+        yang_smallest,
+        yang_smallest_name,
+        yang_total,
+        time_end - time_start,
+    )
+
+
+def main():
+    if len(sys.argv) < 4:
+        print("Usage: get_yang.py <hosts> <user> <output_path> (<debug>)")
+        sys.exit(1)
 
-            if yang_largest < size:
-                yang_largest = size
-                yang_largest_name = state[0] + "@" + state[1]
+    hosts = sys.argv[1]
+    user = sys.argv[2]
+    output_path = sys.argv[3]
 
-            if yang_smallest > size or yang_smallest == 0:
-                yang_smallest = size
-                yang_smallest_name = state[0] + "@" + state[1]
+    debug = False
+    if len(sys.argv) == 5:
+        debug = True
+
+    os.makedirs(output_path, exist_ok=True)
 
-            yang_num += 1
-            yang_total += size
+    # Created up front so the workers can rely on it existing.
+    os.makedirs(os.path.join(output_path, CACHE_DIR_NAME), exist_ok=True)
 
-        time_end = time.time()
+    hosts_list = hosts.split(",")
+
+    # Checksums recorded while downloading, shared between the host workers
+    # and handed to the final comparison so nothing is rehashed. The cache
+    # map holds the hash of each cache inode, keyed by filename.
+    file_checksums = defaultdict(dict)
+    cache_checksums = {}
+    checksum_lock = threading.Lock()
+
+    # Each host is independent, so drain all of them in parallel. Every
+    # worker owns its own SSHClient and SSH subprocess; the only shared
+    # state is the checksum map guarded by its lock.
+    with ThreadPoolExecutor(max_workers=min(32, len(hosts_list))) as executor:
+        results = list(
+            executor.map(
+                lambda h: process_host(
+                    h,
+                    user,
+                    output_path,
+                    debug,
+                    file_checksums,
+                    cache_checksums,
+                    checksum_lock,
+                ),
+                hosts_list,
+            )
+        )
+
+    for result in results:
+        (
+            host,
+            yang_num,
+            yang_largest,
+            yang_largest_name,
+            yang_smallest,
+            yang_smallest_name,
+            yang_total,
+            duration,
+        ) = result
 
         print("")
         print(f"({host}) YANG Modules: {yang_num}")
         print(f"({host}) YANG Largest: {yang_largest_name} ({yang_largest} bytes)")
         print(f"({host}) YANG Smallest: {yang_smallest_name} ({yang_smallest} bytes)")
         print(f"({host}) Total YANG size: {yang_total} bytes")
-        print(f"({host}) Duration: {time_end - time_start:.2f} seconds")
+        print(f"({host}) Duration: {duration:.2f} seconds")
 
-    compare_checksums(output_path)
+    compare_checksums(output_path, file_checksums)
 
 
 if __name__ == "__main__":